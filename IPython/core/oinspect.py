@@ -1100,8 +1100,16 @@ def _source_contains_docstring(src, doc):
             # arbitrary ways.
             return False
 
-    def psearch(self,pattern,ns_table,ns_search=[],
-                ignore_case=False,show_all=False, *, list_types=False):
+    def psearch(
+        self,
+        pattern,
+        ns_table,
+        ns_search=(),
+        ignore_case=False,
+        show_all=False,
+        *,
+        list_types=False,
+    ):
         """Search namespaces with wildcards for objects.
 
         Arguments:
@@ -1114,7 +1122,7 @@ def psearch(self,pattern,ns_table,ns_search=[],
 
         Optional arguments:
 
-          - ns_search: list of namespace names to include in search.
+          - ns_search: iterable of namespace names to include in search.
 
           - ignore_case(False): make the search case-insensitive.
 
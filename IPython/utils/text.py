@@ -277,6 +277,10 @@ def sort(  # type:ignore[override]
 # print_slist = result_display.register(SList)(print_slist)
 
 
+_indent_re = re.compile(r"^", re.MULTILINE)
+_indent_flatten_re = re.compile(r"^\s*", re.MULTILINE)
+
+
 def indent(instr: str, nspaces: int = 4, ntabs: int = 0, flatten: bool = False) -> str:
     """Indent a string a given number of spaces or tabstops.
 
@@ -303,11 +307,8 @@ def indent(instr: str, nspaces: int = 4, ntabs: int = 0, flatten: bool = False)
     if instr is None:
         return
     ind = '\t'*ntabs+' '*nspaces
-    if flatten:
-        pat = re.compile(r'^\s*', re.MULTILINE)
-    else:
-        pat = re.compile(r'^', re.MULTILINE)
-    outstr = re.sub(pat, ind, instr)
+    pat = _indent_flatten_re if flatten else _indent_re
+    outstr = pat.sub(ind, instr)
     if outstr.endswith(os.linesep+ind):
         return outstr[:-len(ind)]
     else:
@@ -382,13 +383,15 @@ def num_ini_spaces(strng: str) -> int:
         return 0
 
 
+_par_re = re.compile(r"\\$", re.MULTILINE)
+
+
 def format_screen(strng: str) -> str:
     """Format a string for screen printing.
 
     This removes some latex-type format codes."""
     # Paragraph continue
-    par_re = re.compile(r'\\$',re.MULTILINE)
-    strng = par_re.sub('',strng)
+    strng = _par_re.sub("", strng)
     return strng
 
 